@@ -18,26 +18,42 @@
 
 import os
 import time
+import logging
+import signal
+import threading
 import typing
 import bittensor as bt
-from typing import List, Dict
+from typing import List, Dict, Optional
 import aiohttp
 import asyncio
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Use uvloop's event loop when it's available
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 # Import oneoneone components
 import oneoneone
 from oneoneone.base.miner import BaseMinerNeuron
 from oneoneone.config import VALIDATOR_MIN_STAKE
+from oneoneone.utils.logging import bt_logging_enabled_for, TRACE_LEVEL_NUM
 from oneoneone.utils.weight_checker import get_weight_checker
 
 # Environment variables for Node.js miner API connection
 MINER_NODE_HOST = os.getenv("MINER_NODE_HOST", "localhost")
 MINER_NODE_PORT = int(os.getenv("MINER_NODE_PORT", 3001))
 
+_VALIDATOR_MIN_STAKE_F = float(VALIDATOR_MIN_STAKE)
+
 
 class Miner(BaseMinerNeuron):
     """
@@ -49,9 +65,84 @@ class Miner(BaseMinerNeuron):
         super(Miner, self).__init__(config=config)
         # Build local API URL for Node.js miner service
         self.local_api_url = f"http://{MINER_NODE_HOST}:{MINER_NODE_PORT}"
+        # Long-lived HTTP session for the Node.js API, created lazily on the axon's event loop
+        self._local_session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # ClientTimeout objects keyed by whole seconds, reused across requests
+        self._timeouts: Dict[int, aiohttp.ClientTimeout] = {}
+        # Strong references to fire-and-forget tasks so they aren't garbage collected
+        self._background_tasks: typing.Set[asyncio.Task] = set()
         bt.logging.info(f"Miner initialized with netuid: {self.config.netuid}")
         bt.logging.info(f"Local API URL: {self.local_api_url}")
 
+    def _index_metagraph(self):
+        """
+        Extends the base lookup structures with a per-uid minimum stake mask
+        and the blacklist settings consulted on every request.
+        """
+        self._stake_ok = (
+            np.asarray(self.metagraph.total_stake) >= _VALIDATOR_MIN_STAKE_F
+        )
+        self._force_permit = bool(self.config.blacklist.force_validator_permit)
+        self._allow_non_reg = bool(self.config.blacklist.allow_non_registered)
+        super()._index_metagraph()
+
+    def _timeout_for(self, seconds: int) -> aiohttp.ClientTimeout:
+        """
+        Get a cached total timeout for the given number of seconds (at least 1).
+
+        Args:
+            seconds: Requested timeout, usually synapse.timeout
+
+        Returns:
+            The aiohttp.ClientTimeout to use for the request
+        """
+        seconds = max(1, int(seconds))
+        timeout = self._timeouts.get(seconds)
+        if timeout is None:
+            timeout = self._timeouts[seconds] = aiohttp.ClientTimeout(total=seconds)
+        return timeout
+
+    async def _get_local_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session used to call the local Node.js API.
+        Reusing one session keeps connections alive between validator requests.
+
+        Returns:
+            The shared aiohttp.ClientSession
+        """
+        if self._local_session is None or self._local_session.closed:
+            self._local_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=None),
+            )
+            self._session_loop = asyncio.get_running_loop()
+        return self._local_session
+
+    async def close_sessions(self):
+        """
+        Close the shared HTTP sessions held by the miner.
+        """
+        if self._local_session is not None and not self._local_session.closed:
+            await self._local_session.close()
+        await get_weight_checker().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        # Sessions are bound to the axon's event loop, so close them there
+        if self._session_loop is not None and self._session_loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.close_sessions(), self._session_loop
+                ).result(timeout=5)
+            except Exception as e:
+                bt.logging.warning(f"Error closing HTTP sessions: {str(e)}")
+
     async def _check_weights_background(self):
         """
         Background task to check validator type weights from GitHub.
@@ -81,9 +172,18 @@ class Miner(BaseMinerNeuron):
         # Record start time when request is received
         start_time = time.time()
 
-        bt.logging.debug(
-            f"Received request - type_id: {synapse.type_id}, metadata: {synapse.metadata}, timeout: {synapse.timeout}"
-        )
+        # Check validator type weights from GitHub concurrently with the local API call.
+        # The task is never awaited here, so it doesn't block the response, and at most
+        # one check is pending at a time so slow GitHub responses can't pile up tasks.
+        if not self._background_tasks:
+            weights_task = asyncio.create_task(self._check_weights_background())
+            self._background_tasks.add(weights_task)
+            weights_task.add_done_callback(self._background_tasks.discard)
+
+        if bt_logging_enabled_for(logging.DEBUG):
+            bt.logging.debug(
+                f"Received request - type_id: {synapse.type_id}, metadata: {synapse.metadata}, timeout: {synapse.timeout}"
+            )
 
         try:
             # Call local Node.js API using typeId endpoint
@@ -95,20 +195,23 @@ class Miner(BaseMinerNeuron):
             }
 
             # Make async HTTP request with timeout from synapse
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url, json=body, timeout=synapse.timeout
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        synapse.responses = data.get("responses", [])
-                        bt.logging.info(
-                            f"Successfully fetched {len(synapse.responses)} responses for type_id: {synapse.type_id}"
-                        )
-                    else:
-                        error_text = await response.text()
-                        bt.logging.error(f"API error {response.status}: {error_text}")
-                        synapse.responses = []
+            session = await self._get_local_session()
+            async with session.post(
+                url,
+                data=orjson.dumps(body),
+                headers={"Content-Type": "application/json"},
+                timeout=self._timeout_for(synapse.timeout),
+            ) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    synapse.responses = data.get("responses", [])
+                    bt.logging.info(
+                        f"Successfully fetched {len(synapse.responses)} responses for type_id: {synapse.type_id}"
+                    )
+                else:
+                    error_text = await response.text()
+                    bt.logging.error(f"API error {response.status}: {error_text}")
+                    synapse.responses = []
 
         except asyncio.TimeoutError:
             bt.logging.error(
@@ -129,9 +232,6 @@ class Miner(BaseMinerNeuron):
             f"({len(synapse.responses)} responses)"
         )
 
-        # Run background tasks after response is ready (doesn't block response)
-        # 1. Check validator type weights from GitHub
-        asyncio.create_task(self._check_weights_background())
         return synapse
 
     async def blacklist(
@@ -151,38 +251,39 @@ class Miner(BaseMinerNeuron):
             bt.logging.warning("Received a request without a dendrite or hotkey.")
             return True, "Missing dendrite or hotkey"
 
+        hotkey = synapse.dendrite.hotkey
+
         # Check if hotkey is registered in the metagraph
-        uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-        if (
-            not self.config.blacklist.allow_non_registered
-            and synapse.dendrite.hotkey not in self.metagraph.hotkeys
-        ):
-            bt.logging.trace(
-                f"Blacklisting un-registered hotkey {synapse.dendrite.hotkey}"
-            )
-            return True, "Unrecognized hotkey"
+        uid = self._hotkey_to_uid.get(hotkey)
+        if uid is None:
+            if not self._allow_non_reg:
+                if bt_logging_enabled_for(TRACE_LEVEL_NUM):
+                    bt.logging.trace(f"Blacklisting un-registered hotkey {hotkey}")
+                return True, "Unrecognized hotkey"
+            # Non-registered callers have no permit or stake to check
+            return False, "Non-registered allowed"
 
         # Only allow validators if configured to enforce validator permits
-        if self.config.blacklist.force_validator_permit:
-            if not self.metagraph.validator_permit[uid]:
-                bt.logging.warning(
-                    f"Blacklisting non-validator hotkey {synapse.dendrite.hotkey}"
-                )
+        if self._force_permit:
+            if not self._validator_permit[uid]:
+                bt.logging.warning(f"Blacklisting non-validator hotkey {hotkey}")
                 return True, "Non-validator hotkey"
 
         # Check if validator has minimum required stake
-        caller_stake = self.metagraph.total_stake[uid]
-        bt.logging.debug(f"Validator neuron total stake: {caller_stake}")
+        if bt_logging_enabled_for(logging.DEBUG):
+            bt.logging.debug(
+                f"Validator neuron total stake: {self.metagraph.total_stake[uid]}"
+            )
 
-        if caller_stake < float(VALIDATOR_MIN_STAKE):
+        if not self._stake_ok[uid]:
+            caller_stake = self.metagraph.total_stake[uid]
             bt.logging.warning(
-                f"Blacklisting hotkey: {synapse.dendrite.hotkey} with insufficient stake, minimum stake required: {VALIDATOR_MIN_STAKE}, current stake: {caller_stake}"
+                f"Blacklisting hotkey: {hotkey} with insufficient stake, minimum stake required: {VALIDATOR_MIN_STAKE}, current stake: {caller_stake}"
             )
             return True, "Insufficient validator stake"
 
-        bt.logging.trace(
-            f"Not blacklisting recognized hotkey {synapse.dendrite.hotkey}"
-        )
+        if bt_logging_enabled_for(TRACE_LEVEL_NUM):
+            bt.logging.trace(f"Not blacklisting recognized hotkey {hotkey}")
         return False, "Hotkey recognized!"
 
     async def priority(self, synapse: oneoneone.protocol.GenericSynapse) -> float:
@@ -201,12 +302,15 @@ class Miner(BaseMinerNeuron):
             return 0.0
 
         # Use stake amount as priority score
-        caller_uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-        priority = float(self.metagraph.S[caller_uid])
+        caller_uid = self._hotkey_to_uid.get(synapse.dendrite.hotkey)
+        if caller_uid is None:
+            return 0.0
+        priority = float(self._priority[caller_uid])
 
-        bt.logging.trace(
-            f"Prioritizing {synapse.dendrite.hotkey} with value: {priority}"
-        )
+        if bt_logging_enabled_for(TRACE_LEVEL_NUM):
+            bt.logging.trace(
+                f"Prioritizing {synapse.dendrite.hotkey} with value: {priority}"
+            )
         return priority
 
 
@@ -215,6 +319,12 @@ if __name__ == "__main__":
     bt.logging.info("Starting oneoneone miner...")
     with Miner() as miner:
         bt.logging.success(f"Miner started successfully on uid: {miner.uid}")
-        while True:
+
+        # Wake up on SIGINT/SIGTERM instead of polling, so shutdown is immediate
+        stop = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop.set())
+
+        while not stop.wait(30):  # Reduced frequency for cleaner logs
             bt.logging.info(f"Miner running... {time.time()}")
-            time.sleep(30)  # Reduced frequency for cleaner logs
+        bt.logging.info("Stopping miner...")
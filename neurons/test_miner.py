@@ -12,6 +12,7 @@ Examples:
     python test_miner.py X 20                     # Test X tweets every 20 minutes
     python test_miner.py GM 5                     # Test Google Maps every 5 minutes
     python test_miner.py X 1 --once               # Test X tweets once
+    python test_miner.py X 5 --batch              # Send all X jobs concurrently every 5 minutes
 """
 
 import os
@@ -20,10 +21,17 @@ import asyncio
 import aiohttp
 import argparse
 import logging
-from datetime import datetime
-from typing import Dict, Any, List
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 import random
 
+# Use uvloop's event loop when it's available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,11 +40,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 
 class TestMiner:
     """Test miner that simulates requests to Node.js miner"""
 
-    def __init__(self, job_type: str, host: str = "localhost", port: int = 3001):
+    def __init__(
+        self,
+        job_type: str,
+        host: str = "localhost",
+        port: int = 3001,
+        batch: bool = False,
+        concurrency: int = 4
+    ):
         """
         Initialize test miner
 
@@ -44,18 +61,38 @@ class TestMiner:
             job_type: Type of job to test ('X' or 'GM')
             host: Node.js miner host
             port: Node.js miner port
+            batch: Send every test job each cycle instead of one random job
+            concurrency: Maximum number of in-flight requests in batch mode
         """
         self.job_type = job_type.upper()
         self.host = host
         self.port = port
+        self.batch = batch
+        self.concurrency = concurrency
         self.api_url = f"http://{host}:{port}"
         self.request_count = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._timeouts: Dict[int, aiohttp.ClientTimeout] = {}
 
         # Sample test data for different job types
         self.test_jobs = self._initialize_test_jobs()
 
-    def _initialize_test_jobs(self) -> List[Dict[str, Any]]:
-        """Initialize sample test jobs based on job type"""
+    def _initialize_test_jobs(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Initialize sample test jobs based on job type.
+        Each job carries its request body pre-serialized as JSON bytes under '_body'.
+        """
+        jobs = self._sample_jobs()
+        for job in jobs:
+            job["_body"] = orjson.dumps({
+                "typeId": job["typeId"],
+                "metadata": job["metadata"],
+                "timeout": job["timeout"]
+            })
+        return tuple(jobs)
+
+    def _sample_jobs(self) -> List[Dict[str, Any]]:
+        """Build the sample job definitions for the configured job type"""
         if self.job_type == "GM":
             # Google Maps Reviews jobs
             return [
@@ -128,6 +165,32 @@ class TestMiner:
         else:
             raise ValueError(f"Invalid job type: {self.job_type}. Use 'X' or 'GM'")
     
+    def _timeout_for(self, seconds: int) -> aiohttp.ClientTimeout:
+        """Get a cached total timeout for the given number of seconds (at least 1)"""
+        seconds = max(1, int(seconds))
+        timeout = self._timeouts.get(seconds)
+        if timeout is None:
+            timeout = self._timeouts[seconds] = aiohttp.ClientTimeout(total=seconds)
+        return timeout
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared, pooled HTTP session on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=256,
+                    limit_per_host=64,
+                    keepalive_timeout=60
+                )
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def send_request(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send a single request to the Node.js miner
@@ -140,32 +203,36 @@ class TestMiner:
         """
         url = f"{self.api_url}/fetch"
         
-        logger.info(f"Sending request #{self.request_count + 1}")
-        logger.info(f"  Type ID: {job['typeId']}")
-        logger.info(f"  Metadata: {job['metadata']}")
-        logger.info(f"  Timeout: {job['timeout']}s")
+        verbose = logger.isEnabledFor(logging.INFO)
+        if verbose:
+            logger.info(f"Sending request #{self.request_count + 1}")
+            logger.info(f"  Type ID: {job['typeId']}")
+            logger.info(f"  Metadata: {job['metadata']}")
+            logger.info(f"  Timeout: {job['timeout']}s")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=job,
-                    timeout=aiohttp.ClientTimeout(total=job['timeout'])
-                ) as response:
-                    status = response.status
-                    data = await response.json()
-                    
-                    if status == 200:
+            session = await self._ensure_session()
+            async with session.post(
+                url,
+                data=job["_body"],
+                headers={"Content-Type": "application/json"},
+                timeout=self._timeout_for(job['timeout'])
+            ) as response:
+                status = response.status
+                data = orjson.loads(await response.read())
+                
+                if status == 200:
+                    if verbose:
                         responses_count = len(data.get('responses', []))
                         logger.info(f"✓ Success: Received {responses_count} responses")
                         logger.info(f"  Status: {data.get('status')}")
                         logger.info(f"  Timestamp: {data.get('timestamp')}")
-                    else:
-                        logger.error(f"✗ Error: HTTP {status}")
-                        logger.error(f"  Response: {data}")
-                    
-                    self.request_count += 1
-                    return data
+                else:
+                    logger.error(f"✗ Error: HTTP {status}")
+                    logger.error(f"  Response: {data}")
+                
+                self.request_count += 1
+                return data
                     
         except asyncio.TimeoutError:
             logger.error(f"✗ Request timeout after {job['timeout']}s")
@@ -184,7 +251,7 @@ class TestMiner:
         """Run a single test cycle with a random job"""
         job = random.choice(self.test_jobs)
         logger.info("=" * 60)
-        logger.info(f"Starting test cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"Starting test cycle at {time.strftime(TIMESTAMP_FORMAT)}")
         logger.info(f"Job Type: {self.job_type}")
         logger.info("=" * 60)
 
@@ -196,6 +263,44 @@ class TestMiner:
 
         return result
 
+    async def run_batch(self):
+        """Run a test cycle that sends all test jobs concurrently"""
+        logger.info("=" * 60)
+        logger.info(f"Starting batch test cycle at {time.strftime(TIMESTAMP_FORMAT)}")
+        logger.info(f"Job Type: {self.job_type}")
+        logger.info(f"Jobs: {len(self.test_jobs)}, concurrency: {self.concurrency}")
+        logger.info("=" * 60)
+
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await self.send_request(job)
+
+        results = await asyncio.gather(
+            *[bounded(job) for job in self.test_jobs],
+            return_exceptions=True
+        )
+
+        logger.info("=" * 60)
+        logger.info(f"Batch test cycle completed. Total requests sent: {self.request_count}")
+        logger.info("=" * 60)
+
+        return results
+
+    async def run_cycle(self):
+        """Run one test cycle in the configured mode"""
+        if self.batch:
+            return await self.run_batch()
+        return await self.run_single_test()
+
+    async def run_once(self):
+        """Run a single test cycle and release the HTTP session"""
+        try:
+            return await self.run_cycle()
+        finally:
+            await self.close()
+
     async def run_continuous(self, interval_minutes: int):
         """
         Run continuous testing with periodic requests
@@ -211,23 +316,30 @@ class TestMiner:
         logger.info(f"Available test jobs: {len(self.test_jobs)}")
         logger.info("=" * 60)
 
-        while True:
-            try:
-                await self.run_single_test()
+        interval_seconds = interval_minutes * 60
 
-                # Wait for the specified interval
-                logger.info(f"\nWaiting {interval_minutes} minutes until next request...")
-                logger.info(f"Next request at: {datetime.fromtimestamp(time.time() + interval_minutes * 60).strftime('%Y-%m-%d %H:%M:%S')}\n")
+        try:
+            while True:
+                try:
+                    await self.run_cycle()
+
+                    # Wait for the specified interval
+                    if logger.isEnabledFor(logging.INFO):
+                        next_at = time.localtime(time.time() + interval_seconds)
+                        logger.info(f"\nWaiting {interval_minutes} minutes until next request...")
+                        logger.info(f"Next request at: {time.strftime(TIMESTAMP_FORMAT, next_at)}\n")
 
-                await asyncio.sleep(interval_minutes * 60)
+                    await asyncio.sleep(interval_seconds)
 
-            except KeyboardInterrupt:
-                logger.info("\n\nTest miner stopped by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in continuous run: {e}")
-                logger.info(f"Retrying in 60 seconds...")
-                await asyncio.sleep(60)
+                except KeyboardInterrupt:
+                    logger.info("\n\nTest miner stopped by user")
+                    break
+                except Exception as e:
+                    logger.error(f"Error in continuous run: {e}")
+                    logger.info(f"Retrying in 60 seconds...")
+                    await asyncio.sleep(60)
+        finally:
+            await self.close()
 
 
 def main():
@@ -241,6 +353,7 @@ Examples:
   %(prog)s GM 5                         # Test Google Maps every 5 minutes
   %(prog)s X 1 --once                   # Test X tweets once
   %(prog)s GM 10 --host 127.0.0.1       # Custom host
+  %(prog)s X 5 --batch --concurrency 2  # Send all jobs, 2 at a time
         """
     )
 
@@ -277,6 +390,19 @@ Examples:
         help='Run once and exit (for testing)'
     )
 
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Send all test jobs concurrently each cycle instead of one random job'
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Maximum in-flight requests in batch mode (default: 4)'
+    )
+
     args = parser.parse_args()
 
     # Validate period
@@ -284,9 +410,20 @@ Examples:
         logger.error("Period must be at least 1 minute")
         return 1
 
+    # Validate concurrency
+    if args.concurrency < 1:
+        logger.error("Concurrency must be at least 1")
+        return 1
+
     # Create test miner instance
     try:
-        test_miner = TestMiner(job_type=args.type, host=args.host, port=args.port)
+        test_miner = TestMiner(
+            job_type=args.type,
+            host=args.host,
+            port=args.port,
+            batch=args.batch,
+            concurrency=args.concurrency
+        )
     except ValueError as e:
         logger.error(str(e))
         return 1
@@ -295,7 +432,7 @@ Examples:
     try:
         if args.once:
             # Run once and exit
-            asyncio.run(test_miner.run_single_test())
+            asyncio.run(test_miner.run_once())
         else:
             # Run continuously
             asyncio.run(test_miner.run_continuous(interval_minutes=args.period))
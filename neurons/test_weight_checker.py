@@ -9,55 +9,26 @@ Usage:
 """
 
 import asyncio
-import aiohttp
-import re
 from typing import Dict
 
-# GitHub URL for validator types configuration
-VALIDATOR_TYPES_URL = "https://raw.githubusercontent.com/oneoneone-io/subnet-111/main/node/utils/validator/types/index.js"
+from oneoneone.utils.weight_checker import WeightChecker, get_weight_checker
 
-# ANSI color codes for terminal output
-class Colors:
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
+# GitHub URL for validator types configuration
+VALIDATOR_TYPES_URL = WeightChecker.GITHUB_RAW_URL
 
 
 async def fetch_validator_weights() -> Dict[str, int]:
     """
-    Fetch and parse validator type weights from GitHub.
+    Fetch and parse validator type weights from GitHub using the shared WeightChecker.
     
     Returns:
         Dictionary with weights for GoogleMapsReviews and XTweets
     """
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(VALIDATOR_TYPES_URL, timeout=10) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    
-                    # Parse the TYPES array using regex
-                    # Looking for: { func: GoogleMapsReviews, weight: 0 },
-                    #              { func: XTweets, weight: 100 }
-                    
-                    gmaps_match = re.search(r'{\s*func:\s*GoogleMapsReviews\s*,\s*weight:\s*(\d+)\s*}', content)
-                    xtweets_match = re.search(r'{\s*func:\s*XTweets\s*,\s*weight:\s*(\d+)\s*}', content)
-                    
-                    gmaps_weight = int(gmaps_match.group(1)) if gmaps_match else 0
-                    xtweets_weight = int(xtweets_match.group(1)) if xtweets_match else 0
-                    
-                    return {
-                        'GoogleMapsReviews': gmaps_weight,
-                        'XTweets': xtweets_weight
-                    }
-                else:
-                    print(f"Failed to fetch validator weights: HTTP {response.status}")
-                    return {'GoogleMapsReviews': -1, 'XTweets': -1}
-    except Exception as e:
-        print(f"Error fetching validator weights: {str(e)}")
+    weights = await get_weight_checker().fetch_weights_from_github()
+    if weights is None:
+        print("Failed to fetch validator weights")
         return {'GoogleMapsReviews': -1, 'XTweets': -1}
+    return weights
 
 
 def print_weight_status(weights: Dict[str, int]):
@@ -75,16 +46,16 @@ def print_weight_status(weights: Dict[str, int]):
         return
     
     # Print weights in yellow
-    print(f"{Colors.YELLOW}{Colors.BOLD}Validator Type Weights:{Colors.RESET}")
-    print(f"{Colors.YELLOW}  GoogleMapsReviews: {gmaps_weight}{Colors.RESET}")
-    print(f"{Colors.YELLOW}  XTweets: {xtweets_weight}{Colors.RESET}")
+    print(f"{WeightChecker.YELLOW}{WeightChecker.BOLD}Validator Type Weights:{WeightChecker.RESET}")
+    print(f"{WeightChecker.YELLOW}  GoogleMapsReviews: {gmaps_weight}{WeightChecker.RESET}")
+    print(f"{WeightChecker.YELLOW}  XTweets: {xtweets_weight}{WeightChecker.RESET}")
     
     # Check if GoogleMaps weight changed from 0
     if gmaps_weight != 0:
-        print(f"{Colors.RED}{Colors.BOLD}***** GM WEIGHT CHANGED *****{Colors.RESET}")
+        print(f"{WeightChecker.RED}{WeightChecker.BOLD}***** GM WEIGHT CHANGED *****{WeightChecker.RESET}")
         print(f"ALERT: GoogleMapsReviews weight changed to {gmaps_weight}!")
     else:
-        print(f"{Colors.GREEN}GM WEIGHT REMAINS 0{Colors.RESET}")
+        print(f"{WeightChecker.GREEN}GM WEIGHT REMAINS 0{WeightChecker.RESET}")
 
 
 async def main():
@@ -99,6 +70,7 @@ async def main():
     
     # Fetch weights
     weights = await fetch_validator_weights()
+    await get_weight_checker().close()
     
     # Display results
     print_weight_status(weights)
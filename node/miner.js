@@ -19,7 +19,7 @@ app.use(express.json());
 app.post('/fetch', fetchRoute.execute);
 
 // Start server and log configuration
-app.listen(PORT, async () => {
+const server = app.listen(PORT, async () => {
   const tweetLimit = process.env.TWEET_LIMIT || config.MINER.X_TWEETS.DEFAULT_TWEET_LIMIT;
 
   logger.info('='.repeat(70));
@@ -58,7 +58,7 @@ app.listen(PORT, async () => {
     let validCount = 0;
 
     results.forEach((result, index) => {
-      const tokenPreview = result.token.substring(0, 30) + '...';
+      const tokenPreview = result.preview;
 
       if (result.isValid) {
         validCount++;
@@ -92,3 +92,11 @@ app.listen(PORT, async () => {
     logger.info('='.repeat(70));
   }
 });
+
+// Release pooled Apify connections and let in-flight requests finish before exiting
+for (const signal of ['SIGINT', 'SIGTERM']) {
+  process.once(signal, () => {
+    apify.closeTokenManager();
+    server.close(() => process.exit(0));
+  });
+}
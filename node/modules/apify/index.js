@@ -19,6 +19,16 @@ function initializeTokenManager() {
   return tokenManager;
 }
 
+/**
+ * Close the token manager's pooled connections, if it was initialized
+ */
+function closeTokenManager() {
+  if (tokenManager) {
+    tokenManager.close();
+    tokenManager = null;
+  }
+}
+
 /**
  * Run any Apify actor and get the results
  * First it calls the actor with the parameters
@@ -68,5 +78,6 @@ async function runActorAndGetResults(actorId, parameters) {
 export default {
   runActorAndGetResults,
   initializeTokenManager,
+  closeTokenManager,
   getCurrentToken
 };
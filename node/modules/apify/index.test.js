@@ -43,4 +43,29 @@ describe('modules/apify', () => {
       }]);
     });
   });
+
+  describe('.closeTokenManager()', () => {
+    beforeEach(() => {
+      process.env.APIFY_TOKENS = 'token-a,token-b';
+    });
+
+    afterEach(() => {
+      delete process.env.APIFY_TOKENS;
+    });
+
+    test('should close the token manager and create a new one on next use', () => {
+      const manager = apify.initializeTokenManager();
+      const closeSpy = jest.spyOn(manager, 'close');
+
+      apify.closeTokenManager();
+
+      expect(closeSpy).toHaveBeenCalledTimes(1);
+      expect(apify.initializeTokenManager()).not.toBe(manager);
+      apify.closeTokenManager();
+    });
+
+    test('should do nothing when the token manager is not initialized', () => {
+      expect(() => apify.closeTokenManager()).not.toThrow();
+    });
+  });
 });
@@ -6,6 +6,7 @@
  */
 
 import axios from 'axios';
+import https from 'https';
 import logger from '#modules/logger/index.js';
 import dotenv from 'dotenv';
 import path from 'path';
@@ -21,17 +22,26 @@ const APIFY_API_BASE = 'https://api.apify.com/v2';
 const MIN_CREDITS_THRESHOLD = process.env.TWEET_LIMIT
       ? (Number.parseInt(process.env.TWEET_LIMIT, 10) + 100) * 0.00025
       : 0.1; // Minimum $0.1 USD credits required
+const checkConcurrency = Number.parseInt(process.env.APIFY_CHECK_CONCURRENCY, 10);
+const CHECK_CONCURRENCY = Math.max(1, Number.isNaN(checkConcurrency) ? 8 : checkConcurrency); // Max parallel credit checks
 
 // Global current token - can be accessed by other modules
 let currentToken = null;
 
+/**
+ * Shorten a token for logging
+ * @param {string} token - The Apify token
+ * @returns {string} The first 25 characters followed by an ellipsis
+ */
+const previewToken = (token) => `${token.slice(0, 25)}...`;
+
 class ApifyTokenManager {
   constructor(tokens) {
-    // Parse tokens from comma-separated string or array
+    // Parse tokens from comma-separated string or array, dropping duplicates
     if (typeof tokens === 'string') {
-      this.tokens = tokens.split(',').map(t => t.trim()).filter(t => t);
+      this.tokens = [...new Set(tokens.split(',').map(t => t.trim()).filter(t => t))];
     } else if (Array.isArray(tokens)) {
-      this.tokens = tokens;
+      this.tokens = [...new Set(tokens)];
     } else {
       throw new Error('Tokens must be a comma-separated string or array');
     }
@@ -40,11 +50,30 @@ class ApifyTokenManager {
       throw new Error('No valid Apify tokens provided');
     }
 
+    // Log-safe token previews, built once
+    this.previews = new Map(this.tokens.map(token => [token, previewToken(token)]));
+
     // Cache for token credits
     this.tokenCredits = new Map();
     this.currentToken = null;
     this.currentTokenIndex = 0; // Track which token we're currently using
     this.failedTokens = new Set(); // Cache of tokens that failed or are depleted
+    this.inFlight = new Map(); // Pending refresh/selection promises shared by concurrent callers
+
+    // Shared HTTP client so credit checks reuse keep-alive connections to api.apify.com
+    this.httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 64 });
+    this.http = axios.create({
+      baseURL: APIFY_API_BASE,
+      timeout: 10000,
+      httpsAgent: this.httpsAgent
+    });
+  }
+
+  /**
+   * Get the log-safe preview of a token
+   */
+  getPreview(token) {
+    return this.previews.get(token) ?? previewToken(token);
   }
 
   /**
@@ -52,17 +81,13 @@ class ApifyTokenManager {
    */
   async getTokenCredits(token) {
     try {
-      // Get user info
-      const userResponse = await axios.get(`${APIFY_API_BASE}/users/me`, {
-        headers: { Authorization: `Bearer ${token}` },
-        timeout: 10000
-      });
-
-      // Get monthly usage
-      const usageResponse = await axios.get(`${APIFY_API_BASE}/users/me/usage/monthly`, {
-        headers: { Authorization: `Bearer ${token}` },
-        timeout: 10000
-      });
+      const headers = { Authorization: `Bearer ${token}` };
+
+      // Get user info and monthly usage in parallel
+      const [userResponse, usageResponse] = await Promise.all([
+        this.http.get('/users/me', { headers }),
+        this.http.get('/users/me/usage/monthly', { headers })
+      ]);
 
       const includedCredits = userResponse.data.data.plan.monthlyUsageCreditsUsd || 0;
       const usedCredits = usageResponse.data.data.totalUsageCreditsUsdAfterVolumeDiscount || 0;
@@ -70,52 +95,85 @@ class ApifyTokenManager {
 
       return {
         token,
+        preview: this.getPreview(token),
         includedCredits,
         usedCredits,
         remainingCredits,
-        isValid: true
+        isValid: true,
+        isHealthy: remainingCredits >= MIN_CREDITS_THRESHOLD
       };
     } catch (error) {
-      logger.error(`Failed to check credits for token ${token.substring(0, 20)}...: ${error.message}`);
+      // Callers report failures (a full refresh logs them as one summary line)
       return {
         token,
+        preview: this.getPreview(token),
         includedCredits: 0,
         usedCredits: 0,
         remainingCredits: 0,
         isValid: false,
+        isHealthy: false,
         error: error.message
       };
     }
   }
 
+  /**
+   * Run a task once at a time; concurrent callers share the in-flight promise
+   * @param {string} key - Identifies the kind of task
+   * @param {Function} task - Async function to run when nothing is in flight for `key`
+   * @returns {Promise<any>} The result of the in-flight task
+   */
+  dedupe(key, task) {
+    if (!this.inFlight.has(key)) {
+      this.inFlight.set(key, task().finally(() => this.inFlight.delete(key)));
+    }
+    return this.inFlight.get(key);
+  }
+
   /**
    * Check credits for all tokens and update cache
    */
-  async checkAllTokens() {
+  checkAllTokens() {
+    return this.dedupe('checkAll', () => this.refreshAllTokenCredits());
+  }
+
+  /**
+   * Fetch credits for every token and update the cache (use checkAllTokens)
+   */
+  async refreshAllTokenCredits() {
     logger.info('Checking credits for all Apify tokens...');
     
-    const results = await Promise.all(
-      this.tokens.map(token => this.getTokenCredits(token))
-    );
-
-    // Update cache
-    results.forEach(result => {
-      this.tokenCredits.set(result.token, result);
-    });
+    // Check tokens with a bounded number of workers to stay under Apify's rate limits,
+    // updating the cache as each check lands so a slow token doesn't hold back the rest
+    const results = Array.from({ length: this.tokens.length });
+    let nextIndex = 0;
+    const worker = async () => {
+      while (nextIndex < this.tokens.length) {
+        const index = nextIndex++;
+        const result = await this.getTokenCredits(this.tokens[index]);
+        results[index] = result;
+        this.tokenCredits.set(result.token, result);
+      }
+    };
+    const workerCount = Math.min(CHECK_CONCURRENCY, this.tokens.length);
+    await Promise.all(Array.from({ length: workerCount }, () => worker()));
 
     this.lastCheckTime = Date.now();
 
-    // Log results
+    // Log results, with all failures collected into a single line
+    const failures = [];
     results.forEach((result, index) => {
-      const tokenPreview = result.token.substring(0, 25) + '...';
       if (result.isValid) {
         logger.info(
-          `Token ${index + 1}: ${tokenPreview} - $${result.remainingCredits.toFixed(4)} remaining (${result.usedCredits.toFixed(4)}/${result.includedCredits.toFixed(2)} used)`
+          `Token ${index + 1}: ${result.preview} - $${result.remainingCredits.toFixed(4)} remaining (${result.usedCredits.toFixed(4)}/${result.includedCredits.toFixed(2)} used)`
         );
       } else {
-        logger.error(`Token ${index + 1}: ${tokenPreview} - INVALID or ERROR`);
+        failures.push(`#${index + 1} ${result.preview}=${result.error}`);
       }
     });
+    if (failures.length > 0) {
+      logger.error(`Apify token failures (INVALID or ERROR): ${failures.join('; ')}`);
+    }
 
     return results;
   }
@@ -143,25 +201,23 @@ class ApifyTokenManager {
       this.lastCheckTime = Date.now();
 
       // Check if token is valid and has enough credits
-      if (tokenInfo.isValid && tokenInfo.remainingCredits >= MIN_CREDITS_THRESHOLD) {
+      if (tokenInfo.isHealthy) {
         // Found a good token!
         this.currentToken = token;
         this.currentTokenIndex = i;
         currentToken = this.currentToken;
 
-        const tokenPreview = token.substring(0, 25) + '...';
-        logger.info(`✓ Selected token #${i + 1}: ${tokenPreview} with $${tokenInfo.remainingCredits.toFixed(4)} remaining`);
+        logger.info(`✓ Selected token #${i + 1}: ${tokenInfo.preview} with $${tokenInfo.remainingCredits.toFixed(4)} remaining`);
 
         return this.currentToken;
       } else {
         // Token failed or depleted - cache it to avoid re-checking
         this.failedTokens.add(token);
 
-        const tokenPreview = token.substring(0, 25) + '...';
         if (!tokenInfo.isValid) {
-          logger.error(`✗ Token #${i + 1}: ${tokenPreview} - INVALID (cached)`);
+          logger.error(`✗ Token #${i + 1}: ${tokenInfo.preview} - INVALID (cached): ${tokenInfo.error}`);
         } else {
-          logger.warning(`⚠ Token #${i + 1}: ${tokenPreview} - Below threshold $${tokenInfo.remainingCredits.toFixed(4)} (cached)`);
+          logger.warning(`⚠ Token #${i + 1}: ${tokenInfo.preview} - Below threshold $${tokenInfo.remainingCredits.toFixed(4)} (cached)`);
         }
       }
     }
@@ -176,7 +232,7 @@ class ApifyTokenManager {
   async getCurrentToken() {
     // If no token selected yet, select first available
     if (!this.currentToken) {
-      return await this.selectNextToken();
+      return await this.dedupe('select', () => this.selectNextToken());
     }
 
     // Return cached current token (no checking)
@@ -188,7 +244,14 @@ class ApifyTokenManager {
    * Check current token after API call and switch if depleted
    * This should be called AFTER sending response to validator (non-blocking)
    */
-  async checkAndRotateToken() {
+  checkAndRotateToken() {
+    return this.dedupe('rotate', () => this.rotateIfDepleted());
+  }
+
+  /**
+   * Check the current token and move to the next one if depleted (use checkAndRotateToken)
+   */
+  async rotateIfDepleted() {
     // If no token selected, nothing to check
     if (!this.currentToken) {
       return;
@@ -203,32 +266,39 @@ class ApifyTokenManager {
       this.tokenCredits.set(this.currentToken, tokenInfo);
 
       // If current token is still good, keep using it
-      if (tokenInfo.isValid && tokenInfo.remainingCredits >= MIN_CREDITS_THRESHOLD) {
+      if (tokenInfo.isHealthy) {
         logger.info(`Current token still valid with $${tokenInfo.remainingCredits.toFixed(4)} remaining`);
         return;
       } else {
         // Current token failed or depleted - cache it and move to next
         this.failedTokens.add(this.currentToken);
 
-        const tokenPreview = this.currentToken.substring(0, 25) + '...';
         if (!tokenInfo.isValid) {
-          logger.warning(`Current token #${this.currentTokenIndex + 1}: ${tokenPreview} - INVALID, switching to next token`);
+          logger.warning(`Current token #${this.currentTokenIndex + 1}: ${tokenInfo.preview} - INVALID (${tokenInfo.error}), switching to next token`);
         } else {
-          logger.warning(`Current token #${this.currentTokenIndex + 1}: ${tokenPreview} - Below threshold $${tokenInfo.remainingCredits.toFixed(4)}, switching to next token`);
+          logger.warning(`Current token #${this.currentTokenIndex + 1}: ${tokenInfo.preview} - Below threshold $${tokenInfo.remainingCredits.toFixed(4)}, switching to next token`);
         }
 
         // Move to next token
         this.currentTokenIndex++;
         this.currentToken = null;
 
-        // Select next token (this will update currentToken)
-        await this.selectNextToken();
+        // Select next token (this will update currentToken); a concurrent
+        // getCurrentToken() call shares this selection instead of starting another
+        await this.dedupe('select', () => this.selectNextToken());
       }
     } catch (error) {
       logger.error(`Error checking token: ${error.message}`);
     }
   }
 
+  /**
+   * Close pooled connections to the Apify API
+   */
+  close() {
+    this.httpsAgent.destroy();
+  }
+
   /**
    * Reset failed tokens cache (useful for testing or when tokens are refilled)
    */
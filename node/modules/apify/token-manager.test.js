@@ -0,0 +1,465 @@
+import ApifyTokenManager, { getCurrentToken } from './token-manager.js';
+import logger from '#modules/logger/index.js';
+
+const mockHttp = { get: jest.fn() };
+
+jest.mock('axios', () => ({
+  create: () => mockHttp
+}));
+jest.mock('dotenv', () => ({
+  config: jest.fn()
+}));
+jest.mock('#modules/logger/index.js', () => ({
+  info: jest.fn(),
+  warning: jest.fn(),
+  error: jest.fn()
+}));
+
+// Credits per token: { included, used } or an Error to reject with
+const mockCredits = new Map();
+
+const tick = () => new Promise(resolve => setImmediate(resolve));
+
+const loadTokenManager = async (environment) => {
+  let TokenManager;
+  await jest.isolateModulesAsync(async () => {
+    Object.assign(process.env, environment);
+    ({ default: TokenManager } = await import('./token-manager.js'));
+  });
+  return TokenManager;
+};
+
+const trackConcurrency = (manager) => {
+  const stats = { active: 0, peak: 0 };
+  const getTokenCredits = manager.getTokenCredits.bind(manager);
+  jest.spyOn(manager, 'getTokenCredits').mockImplementation(async (token) => {
+    stats.active++;
+    stats.peak = Math.max(stats.peak, stats.active);
+    await tick();
+    stats.active--;
+    return getTokenCredits(token);
+  });
+  return stats;
+};
+
+describe('modules/apify/token-manager', () => {
+  const originalEnvironment = process.env;
+  let managers;
+
+  const createManager = (tokens, TokenManager = ApifyTokenManager) => {
+    const manager = new TokenManager(tokens);
+    managers.push(manager);
+    return manager;
+  };
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    process.env = { ...originalEnvironment };
+    delete process.env.TWEET_LIMIT;
+    delete process.env.APIFY_CHECK_CONCURRENCY;
+    managers = [];
+
+    mockCredits.clear();
+    mockCredits.set('good1', { included: 5, used: 1 });
+    mockCredits.set('good2', { included: 5, used: 2 });
+    mockCredits.set('low1', { included: 5, used: 5 });
+    mockCredits.set('bad1', new Error('Request failed with status code 401'));
+    mockCredits.set('bad2', new Error('timeout of 10000ms exceeded'));
+
+    mockHttp.get.mockImplementation(async (url, { headers }) => {
+      const credits = mockCredits.get(headers.Authorization.replace('Bearer ', ''));
+      if (credits instanceof Error) {
+        throw credits;
+      }
+      return url === '/users/me'
+        ? { data: { data: { plan: { monthlyUsageCreditsUsd: credits.included } } } }
+        : { data: { data: { totalUsageCreditsUsdAfterVolumeDiscount: credits.used } } };
+    });
+  });
+
+  afterEach(() => {
+    for (const manager of managers) {
+      manager.close();
+    }
+    process.env = originalEnvironment;
+  });
+
+  describe('constructor', () => {
+    test('should parse a comma-separated string, dropping blanks and duplicates', () => {
+      const manager = createManager(' good1, ,good2,good1 ');
+
+      expect(manager.tokens).toEqual(['good1', 'good2']);
+    });
+
+    test('should drop duplicates from an array', () => {
+      const manager = createManager(['good1', 'good2', 'good1']);
+
+      expect(manager.tokens).toEqual(['good1', 'good2']);
+    });
+
+    test('should throw for an unsupported tokens value', () => {
+      expect(() => new ApifyTokenManager(42)).toThrow('Tokens must be a comma-separated string or array');
+    });
+
+    test('should throw when no tokens are provided', () => {
+      expect(() => new ApifyTokenManager(' , ')).toThrow('No valid Apify tokens provided');
+    });
+  });
+
+  describe('.getPreview()', () => {
+    test('should return the precomputed preview of a known token', () => {
+      const token = 'apify_api_0123456789abcdefghijklmnop';
+      const manager = createManager([token]);
+
+      expect(manager.getPreview(token)).toBe('apify_api_0123456789abcde...');
+      expect(manager.getPreview(token)).toBe(manager.previews.get(token));
+    });
+
+    test('should build a preview for an unknown token', () => {
+      const manager = createManager('good1');
+
+      expect(manager.getPreview('other')).toBe('other...');
+    });
+  });
+
+  describe('.getTokenCredits()', () => {
+    test('should return the remaining credits of a healthy token', async () => {
+      const manager = createManager('good1');
+
+      const result = await manager.getTokenCredits('good1');
+
+      expect(result).toEqual({
+        token: 'good1',
+        preview: 'good1...',
+        includedCredits: 5,
+        usedCredits: 1,
+        remainingCredits: 4,
+        isValid: true,
+        isHealthy: true
+      });
+      expect(mockHttp.get).toHaveBeenCalledWith('/users/me', { headers: { Authorization: 'Bearer good1' } });
+      expect(mockHttp.get).toHaveBeenCalledWith('/users/me/usage/monthly', { headers: { Authorization: 'Bearer good1' } });
+    });
+
+    test('should mark a depleted token as not healthy', async () => {
+      const manager = createManager('low1');
+
+      const result = await manager.getTokenCredits('low1');
+
+      expect(result.isValid).toBe(true);
+      expect(result.isHealthy).toBe(false);
+      expect(result.remainingCredits).toBe(0);
+    });
+
+    test('should default missing credit fields to 0', async () => {
+      mockCredits.set('empty1', {});
+      const manager = createManager('empty1');
+
+      const result = await manager.getTokenCredits('empty1');
+
+      expect(result.includedCredits).toBe(0);
+      expect(result.usedCredits).toBe(0);
+      expect(result.isHealthy).toBe(false);
+    });
+
+    test('should return the error without logging it', async () => {
+      const manager = createManager('bad1');
+
+      const result = await manager.getTokenCredits('bad1');
+
+      expect(result).toEqual({
+        token: 'bad1',
+        preview: 'bad1...',
+        includedCredits: 0,
+        usedCredits: 0,
+        remainingCredits: 0,
+        isValid: false,
+        isHealthy: false,
+        error: 'Request failed with status code 401'
+      });
+      expect(logger.error).not.toHaveBeenCalled();
+    });
+
+    test('should apply the TWEET_LIMIT-based credit threshold', async () => {
+      mockCredits.set('mid1', { included: 5, used: 4.8 });
+      const TokenManager = await loadTokenManager({ TWEET_LIMIT: '1000' });
+      const manager = createManager('mid1', TokenManager);
+
+      const result = await manager.getTokenCredits('mid1');
+
+      expect(result.remainingCredits).toBeCloseTo(0.2);
+      expect(result.isHealthy).toBe(false);
+    });
+  });
+
+  describe('.checkAllTokens()', () => {
+    test('should share one refresh between concurrent callers', async () => {
+      const manager = createManager('good1,low1,bad1');
+      jest.spyOn(manager, 'refreshAllTokenCredits');
+
+      const [first, second] = await Promise.all([manager.checkAllTokens(), manager.checkAllTokens()]);
+
+      expect(first).toBe(second);
+      expect(manager.refreshAllTokenCredits).toHaveBeenCalledTimes(1);
+      expect(mockHttp.get).toHaveBeenCalledTimes(6);
+      expect(manager.inFlight.size).toBe(0);
+    });
+
+    test('should start a new refresh once the previous one finished', async () => {
+      const manager = createManager('good1');
+
+      await manager.checkAllTokens();
+      await manager.checkAllTokens();
+
+      expect(mockHttp.get).toHaveBeenCalledTimes(4);
+    });
+
+    test('should return results in token order and cache them', async () => {
+      const manager = createManager('good1,low1,bad1');
+
+      const results = await manager.checkAllTokens();
+
+      expect(results.map(result => result.token)).toEqual(['good1', 'low1', 'bad1']);
+      expect(manager.tokenCredits.get('good1')).toBe(results[0]);
+      expect(manager.tokenCredits.get('bad1')).toBe(results[2]);
+      expect(manager.lastCheckTime).toEqual(expect.any(Number));
+    });
+
+    test('should log all failures in a single line', async () => {
+      const manager = createManager('bad1,good1,bad2');
+
+      await manager.checkAllTokens();
+
+      expect(logger.error).toHaveBeenCalledTimes(1);
+      expect(logger.error).toHaveBeenCalledWith(
+        'Apify token failures (INVALID or ERROR): #1 bad1...=Request failed with status code 401; #3 bad2...=timeout of 10000ms exceeded'
+      );
+    });
+
+    test('should not log failures when every token is valid', async () => {
+      const manager = createManager('good1,good2');
+
+      await manager.checkAllTokens();
+
+      expect(logger.error).not.toHaveBeenCalled();
+    });
+
+    test('should check at most 8 tokens at a time by default', async () => {
+      const tokens = Array.from({ length: 12 }, (_, index) => `token${index}`);
+      tokens.forEach(token => mockCredits.set(token, { included: 5, used: 1 }));
+      const manager = createManager(tokens);
+      const stats = trackConcurrency(manager);
+
+      const results = await manager.checkAllTokens();
+
+      expect(stats.peak).toBe(8);
+      expect(results).toHaveLength(12);
+      expect(results.every(result => result.isValid)).toBe(true);
+    });
+
+    test('should honour APIFY_CHECK_CONCURRENCY', async () => {
+      const TokenManager = await loadTokenManager({ APIFY_CHECK_CONCURRENCY: '2' });
+      const manager = createManager('good1,good2,low1,bad1,bad2', TokenManager);
+      const stats = trackConcurrency(manager);
+
+      const results = await manager.checkAllTokens();
+
+      expect(stats.peak).toBe(2);
+      expect(results.map(result => result.token)).toEqual(['good1', 'good2', 'low1', 'bad1', 'bad2']);
+    });
+
+    test('should use a single worker when APIFY_CHECK_CONCURRENCY is 0', async () => {
+      const TokenManager = await loadTokenManager({ APIFY_CHECK_CONCURRENCY: '0' });
+      const manager = createManager('good1,good2,low1', TokenManager);
+      const stats = trackConcurrency(manager);
+
+      const results = await manager.checkAllTokens();
+
+      expect(stats.peak).toBe(1);
+      expect(results).toHaveLength(3);
+    });
+
+    test('should use a single worker when APIFY_CHECK_CONCURRENCY is negative', async () => {
+      const TokenManager = await loadTokenManager({ APIFY_CHECK_CONCURRENCY: '-1' });
+      const manager = createManager('good1,good2,low1', TokenManager);
+      const stats = trackConcurrency(manager);
+
+      const results = await manager.checkAllTokens();
+
+      expect(stats.peak).toBe(1);
+      expect(results).toHaveLength(3);
+    });
+  });
+
+  describe('.selectNextToken()', () => {
+    test('should skip invalid and depleted tokens and select the first healthy one', async () => {
+      const manager = createManager('bad1,low1,good1,good2');
+
+      const token = await manager.selectNextToken();
+
+      expect(token).toBe('good1');
+      expect(manager.currentTokenIndex).toBe(2);
+      expect(getCurrentToken()).toBe('good1');
+      expect([...manager.failedTokens]).toEqual(['bad1', 'low1']);
+      expect(logger.error).toHaveBeenCalledWith('✗ Token #1: bad1... - INVALID (cached): Request failed with status code 401');
+      expect(logger.warning).toHaveBeenCalledWith('⚠ Token #2: low1... - Below threshold $0.0000 (cached)');
+    });
+
+    test('should skip tokens already cached as failed without checking them', async () => {
+      const manager = createManager('bad1,good1');
+      manager.failedTokens.add('bad1');
+
+      await manager.selectNextToken();
+
+      expect(logger.info).toHaveBeenCalledWith('Skipping token #1 (cached as failed)');
+      expect(mockHttp.get).toHaveBeenCalledTimes(2);
+    });
+
+    test('should throw when no token is usable', async () => {
+      const manager = createManager('bad1,low1');
+
+      await expect(manager.selectNextToken()).rejects.toThrow('No valid Apify tokens available');
+    });
+  });
+
+  describe('.getCurrentToken()', () => {
+    test('should share one selection between concurrent callers', async () => {
+      const manager = createManager('bad1,good1');
+      jest.spyOn(manager, 'selectNextToken');
+
+      const tokens = await Promise.all([manager.getCurrentToken(), manager.getCurrentToken()]);
+
+      expect(tokens).toEqual(['good1', 'good1']);
+      expect(manager.selectNextToken).toHaveBeenCalledTimes(1);
+      expect(mockHttp.get).toHaveBeenCalledTimes(4);
+    });
+
+    test('should return the selected token without checking it again', async () => {
+      const manager = createManager('good1');
+      await manager.getCurrentToken();
+      mockHttp.get.mockClear();
+
+      const token = await manager.getCurrentToken();
+
+      expect(token).toBe('good1');
+      expect(mockHttp.get).not.toHaveBeenCalled();
+    });
+  });
+
+  describe('.checkAndRotateToken()', () => {
+    test('should do nothing before a token is selected', async () => {
+      const manager = createManager('good1');
+
+      await manager.checkAndRotateToken();
+
+      expect(mockHttp.get).not.toHaveBeenCalled();
+    });
+
+    test('should keep the current token while it is healthy', async () => {
+      const manager = createManager('good1,good2');
+      await manager.getCurrentToken();
+
+      await manager.checkAndRotateToken();
+
+      expect(manager.currentToken).toBe('good1');
+      expect(logger.info).toHaveBeenCalledWith('Current token still valid with $4.0000 remaining');
+    });
+
+    test('should share one check between concurrent callers', async () => {
+      const manager = createManager('good1');
+      await manager.getCurrentToken();
+      jest.spyOn(manager, 'rotateIfDepleted');
+
+      await Promise.all([manager.checkAndRotateToken(), manager.checkAndRotateToken()]);
+
+      expect(manager.rotateIfDepleted).toHaveBeenCalledTimes(1);
+    });
+
+    test('should switch to the next token once the current one is depleted', async () => {
+      const manager = createManager('good1,good2');
+      await manager.getCurrentToken();
+      mockCredits.set('good1', { included: 5, used: 5 });
+
+      await manager.checkAndRotateToken();
+
+      expect(manager.currentToken).toBe('good2');
+      expect(manager.failedTokens.has('good1')).toBe(true);
+      expect(logger.warning).toHaveBeenCalledWith(
+        'Current token #1: good1... - Below threshold $0.0000, switching to next token'
+      );
+    });
+
+    test('should switch to the next token once the current one is invalid', async () => {
+      const manager = createManager('good1,good2');
+      await manager.getCurrentToken();
+      mockCredits.set('good1', new Error('Request failed with status code 403'));
+
+      await manager.checkAndRotateToken();
+
+      expect(manager.currentToken).toBe('good2');
+      expect(logger.warning).toHaveBeenCalledWith(
+        'Current token #1: good1... - INVALID (Request failed with status code 403), switching to next token'
+      );
+    });
+
+    test('should share its selection with a getCurrentToken() call made during rotation', async () => {
+      const manager = createManager('good1,bad1,good2');
+      await manager.getCurrentToken();
+      mockCredits.set('good1', { included: 5, used: 5 });
+      const selectNextToken = manager.selectNextToken.bind(manager);
+      let selectionStarted;
+      const started = new Promise(resolve => {
+        selectionStarted = resolve;
+      });
+      jest.spyOn(manager, 'selectNextToken').mockImplementation(() => {
+        selectionStarted();
+        return selectNextToken();
+      });
+
+      const rotation = manager.checkAndRotateToken();
+      await started;
+      expect(manager.currentToken).toBeNull();
+      const token = await manager.getCurrentToken();
+      await rotation;
+
+      expect(token).toBe('good2');
+      expect(manager.selectNextToken).toHaveBeenCalledTimes(1);
+    });
+
+    test('should log when no replacement token is available', async () => {
+      const manager = createManager('good1,low1');
+      await manager.getCurrentToken();
+      mockCredits.set('good1', { included: 5, used: 5 });
+
+      await manager.checkAndRotateToken();
+
+      expect(manager.currentToken).toBeNull();
+      expect(logger.error).toHaveBeenCalledWith(
+        'Error checking token: No valid Apify tokens available. All tokens are either invalid or below threshold.'
+      );
+    });
+  });
+
+  describe('.close()', () => {
+    test('should destroy the pooled HTTPS agent', () => {
+      const manager = createManager('good1');
+      jest.spyOn(manager.httpsAgent, 'destroy');
+
+      manager.close();
+
+      expect(manager.httpsAgent.destroy).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('.resetFailedTokens()', () => {
+    test('should clear the failed tokens cache', () => {
+      const manager = createManager('good1');
+      manager.failedTokens.add('good1');
+
+      manager.resetFailedTokens();
+
+      expect(manager.failedTokens.size).toBe(0);
+      expect(logger.info).toHaveBeenCalledWith('Failed tokens cache cleared');
+    });
+  });
+});
@@ -49,7 +49,7 @@ async function main() {
     let invalidCount = 0;
 
     results.forEach((result, index) => {
-      const tokenPreview = result.token.substring(0, 30) + '...';
+      const tokenPreview = result.preview;
 
       if (result.isValid) {
         validCount++;
@@ -93,7 +93,9 @@ async function main() {
   } catch (error) {
     console.error(`\n❌ Error: ${error.message}`);
     console.log('='.repeat(70));
-    process.exit(1);
+    process.exitCode = 1;
+  } finally {
+    apify.closeTokenManager();
   }
 }
 
@@ -25,18 +25,17 @@ async function testTokenManager() {
     process.exit(1);
   }
 
-  const tokenList = tokens.split(',').map(t => t.trim()).filter(t => t);
-  console.log(`📋 Found ${tokenList.length} token(s) in environment`);
-  tokenList.forEach((token, i) => {
-    console.log(`   Token ${i + 1}: ${token.substring(0, 25)}...`);
-  });
-  console.log();
-
   // Initialize token manager
   console.log('🔧 Initializing token manager...');
   const tokenManager = new ApifyTokenManager(tokens);
   console.log();
 
+  console.log(`📋 Found ${tokenManager.tokens.length} token(s) in environment`);
+  tokenManager.tokens.forEach((token, i) => {
+    console.log(`   Token ${i + 1}: ${tokenManager.getPreview(token)}`);
+  });
+  console.log();
+
   // Test 1: Check all tokens
   console.log('='.repeat(70));
   console.log('Test 1: Check Credits for All Tokens');
@@ -55,15 +54,15 @@ async function testTokenManager() {
   console.log(`   Invalid tokens: ${results.length - validCount}`);
   console.log();
 
-  // Test 2: Select best token
+  // Test 2: Select the first usable token
   console.log('='.repeat(70));
-  console.log('Test 2: Select Best Token');
+  console.log('Test 2: Select Next Token');
   console.log('='.repeat(70));
   console.log();
 
-  const bestToken = await tokenManager.selectBestToken();
+  const selectedToken = await tokenManager.selectNextToken();
   console.log();
-  console.log(`✅ Best token selected: ${bestToken.substring(0, 25)}...`);
+  console.log(`✅ Token selected: ${tokenManager.getPreview(selectedToken)}`);
   console.log();
 
   // Test 3: Get current token (should use cache)
@@ -73,7 +72,7 @@ async function testTokenManager() {
   console.log();
 
   const currentToken = await tokenManager.getCurrentToken();
-  console.log(`✅ Current token: ${currentToken.substring(0, 25)}...`);
+  console.log(`✅ Current token: ${tokenManager.getPreview(currentToken)}`);
   console.log();
 
   // Display detailed info for each token
@@ -83,7 +82,7 @@ async function testTokenManager() {
   console.log();
 
   results.forEach((result, i) => {
-    const tokenPreview = result.token.substring(0, 30) + '...';
+    const tokenPreview = result.preview;
     console.log(`Token ${i + 1}: ${tokenPreview}`);
     console.log('-'.repeat(70));
 
@@ -111,6 +110,8 @@ async function testTokenManager() {
     console.log();
   });
 
+  tokenManager.close();
+
   console.log('='.repeat(70));
   console.log('Test Completed!');
   console.log('='.repeat(70));
@@ -16,11 +16,13 @@
 # DEALINGS IN THE SOFTWARE.
 
 import time
+import typing
 import asyncio
 import threading
 import argparse
 import traceback
 
+import numpy as np
 import bittensor as bt
 
 from oneoneone.base.neuron import BaseNeuron
@@ -68,6 +70,9 @@ class BaseMinerNeuron(BaseNeuron):
         )
         bt.logging.info(f"Axon created: {self.axon}")
 
+        # Build lookup structures for the current metagraph.
+        self._index_metagraph()
+
         # Instantiate runners
         self.should_exit: bool = False
         self.is_running: bool = False
@@ -193,3 +198,17 @@ class BaseMinerNeuron(BaseNeuron):
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
+
+        # Rebuild lookup structures for the new metagraph.
+        self._index_metagraph()
+
+    def _index_metagraph(self):
+        """
+        Builds per-sync lookup structures used on the request path, so blacklist and priority
+        don't need to scan the metagraph for every request.
+        """
+        self._validator_permit = np.asarray(self.metagraph.validator_permit, dtype=bool)
+        self._priority = np.asarray(self.metagraph.S, dtype=np.float32)
+        self._hotkey_to_uid: typing.Dict[str, int] = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
@@ -2,7 +2,10 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 
+import bittensor as bt
+
 EVENTS_LEVEL_NUM = 38
+TRACE_LEVEL_NUM = 5
 DEFAULT_LOG_BACKUP_COUNT = 10
 
 
@@ -33,3 +36,11 @@ def setup_events_logger(full_path, events_retention_size):
     logger.addHandler(file_handler)
 
     return logger
+
+
+def bt_logging_enabled_for(level: int) -> bool:
+    """
+    Check whether bittensor's logger would emit a record at `level`, so callers can skip
+    building expensive log messages that would be discarded.
+    """
+    return bt.logging.get_level() <= level
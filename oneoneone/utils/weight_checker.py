@@ -8,9 +8,46 @@ GitHub Source: https://github.com/oneoneone-io/subnet-111/blob/main/node/utils/v
 """
 
 import re
+import hashlib
+import functools
+import time
+import random
 import aiohttp
 import asyncio
-from typing import Dict, Optional, Tuple
+from typing import Dict, Final, Optional, Tuple
+
+
+# ANSI color codes
+_YELLOW: Final = '\033[93m'
+_RED: Final = '\033[91m'
+_GREEN: Final = '\033[92m'
+_RESET: Final = '\033[0m'
+_BOLD: Final = '\033[1m'
+
+# Pre-formatted alert output
+_BAR_RED: Final = f"{_RED}{_BOLD}{'━' * 60}{_RESET}"
+_GM_ALERT_HEADER: Final = f"{_RED}{_BOLD}⚠️  ALERT: GM WEIGHT CHANGED!{_RESET}"
+_GM_REMAINS_0: Final = f"{_GREEN}{_BOLD}✓ GM WEIGHT REMAINS 0{_RESET}"
+
+# Pattern to match: { func: GoogleMapsReviews, weight: 0 }, and { func: XTweets, weight: 100 }
+_TYPES_RE = re.compile(rb'\{\s*func:\s*(GoogleMapsReviews|XTweets)\s*,\s*weight:\s*(\d+)\s*\}', re.ASCII)
+
+
+def _types_block_bounds(content: bytes) -> Tuple[int, int]:
+    """
+    Locate the `const TYPES = [...]` array so the regex only scans that region.
+    
+    Args:
+        content: The raw JavaScript file content
+        
+    Returns:
+        (start, end) offsets of the block, or the whole content if it can't be found
+    """
+    start = content.find(b'TYPES = [')
+    if start < 0:
+        return 0, len(content)
+    end = content.find(b']', start)
+    return start, (end + 1 if end >= 0 else len(content))
 
 
 class WeightChecker:
@@ -20,77 +57,185 @@ class WeightChecker:
     
     GITHUB_RAW_URL = "https://raw.githubusercontent.com/oneoneone-io/subnet-111/main/node/utils/validator/types/index.js"
     
+    # Bounds, in seconds, for reusing fetched weights before asking GitHub again.
+    # The interval backs off while weights are unchanged and resets when they change.
+    MIN_POLL_S = 60.0
+    MAX_POLL_S = 900.0
+    POLL_BACKOFF = 1.5
+    POLL_JITTER = 0.1
+    
     # ANSI color codes
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
+    YELLOW = _YELLOW
+    RED = _RED
+    GREEN = _GREEN
+    RESET = _RESET
+    BOLD = _BOLD
     
     def __init__(self):
         self.last_gm_weight: Optional[int] = None
         self.last_x_weight: Optional[int] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Cached weights and HTTP validators from the last successful fetch
+        self._cached_weights: Optional[Dict[str, int]] = None
+        self._poll_s: float = self.MIN_POLL_S
+        self._next_fetch_at: float = 0.0
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._last_body_digest: Optional[bytes] = None
+        # Whether the most recent GitHub request failed (cached weights are then stale)
+        self._last_fetch_failed: bool = False
+        self._fetch_lock = asyncio.Lock()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session used for GitHub requests, creating it on first use.
+        
+        Returns:
+            The shared aiohttp.ClientSession
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=None),
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """
+        Close the shared GitHub session.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _is_cache_fresh(self) -> bool:
+        """Check whether GitHub should not be asked again yet (also covers the retry wait after a failure)."""
+        return time.monotonic() < self._next_fetch_at
+    
+    def _schedule_next_fetch(self, changed: bool) -> None:
+        """
+        Pick the next refresh time: back off while weights are unchanged, poll quickly after a change.
+        Jitter keeps miners that started together from polling in lockstep.
+        
+        Args:
+            changed: Whether the latest fetch returned different weights
+        """
+        if changed:
+            self._poll_s = self.MIN_POLL_S
+        else:
+            self._poll_s = min(self._poll_s * self.POLL_BACKOFF, self.MAX_POLL_S)
+        jitter = random.uniform(-self.POLL_JITTER, self.POLL_JITTER) * self._poll_s
+        self._next_fetch_at = time.monotonic() + self._poll_s + jitter
     
     async def fetch_weights_from_github(self) -> Optional[Dict[str, int]]:
         """
         Fetch the weights from GitHub repository.
+        Results are cached for an adaptive interval and concurrent callers share one request.
+        
+        A failed fetch is retried after MIN_POLL_S; until then the last known (stale) weights are returned
+        and `_last_fetch_failed` stays set.
+        
+        Returns:
+            Dictionary with 'GoogleMapsReviews' and 'XTweets' weights, or None if none are known
+        """
+        if self._is_cache_fresh():
+            return self._cached_weights
+        
+        async with self._fetch_lock:
+            # Another caller may have refreshed the cache while we waited
+            if self._is_cache_fresh():
+                return self._cached_weights
+            
+            weights = await self._request_weights()
+            self._last_fetch_failed = weights is None
+            if weights is None:
+                # Back off so an outage or rate limit doesn't trigger a request per caller
+                self._next_fetch_at = time.monotonic() + self.MIN_POLL_S
+                return self._cached_weights
+            
+            self._schedule_next_fetch(changed=weights != self._cached_weights)
+            self._cached_weights = weights
+            return weights
+    
+    async def _request_weights(self) -> Optional[Dict[str, int]]:
+        """
+        Request the types file from GitHub, revalidating the cached copy when possible.
         
         Returns:
-            Dictionary with 'GoogleMapsReviews' and 'XTweets' weights, or None if failed
+            Dictionary with weights, or None if failed
         """
+        headers = {}
+        if self._cached_weights is not None:
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.GITHUB_RAW_URL, timeout=10) as response:
-                    if response.status != 200:
-                        return None
-                    
-                    content = await response.text()
-                    return self._parse_weights(content)
+            session = await self._get_session()
+            async with session.get(
+                self.GITHUB_RAW_URL,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                # Unchanged since the last fetch
+                if response.status == 304:
+                    return self._cached_weights
+                
+                if response.status != 200:
+                    return None
+                
+                # The patterns are pure ASCII, so match on the raw body without decoding
+                content = await response.read()
+                
+                # A 200 with an identical body needs no re-parse
+                digest = hashlib.blake2b(content, digest_size=16).digest()
+                if digest == self._last_body_digest and self._cached_weights is not None:
+                    weights = self._cached_weights
+                else:
+                    weights = self._parse_weights(content)
+                
+                if weights is not None:
+                    self._last_body_digest = digest
+                    self._etag = response.headers.get('ETag')
+                    self._last_modified = response.headers.get('Last-Modified')
+                return weights
         
         except asyncio.TimeoutError:
             return None
         except Exception:
             return None
     
-    def _parse_weights(self, content: str) -> Optional[Dict[str, int]]:
+    def _parse_weights(self, content: bytes) -> Optional[Dict[str, int]]:
         """
         Parse the JavaScript file content to extract weights.
         
         Args:
-            content: The JavaScript file content
+            content: The raw JavaScript file content
             
         Returns:
             Dictionary with weights or None if parsing failed
         """
         try:
-            # Pattern to match: { func: GoogleMapsReviews, weight: 0 },
-            gm_pattern = r'\{\s*func:\s*GoogleMapsReviews\s*,\s*weight:\s*(\d+)\s*\}'
-            x_pattern = r'\{\s*func:\s*XTweets\s*,\s*weight:\s*(\d+)\s*\}'
-            
-            gm_match = re.search(gm_pattern, content)
-            x_match = re.search(x_pattern, content)
+            # Single pass over the TYPES block; the first entry for each type wins
+            weights: Dict[str, int] = {}
+            for match in _TYPES_RE.finditer(content, *_types_block_bounds(content)):
+                weights.setdefault(match.group(1).decode('ascii'), int(match.group(2)))
             
-            if gm_match and x_match:
-                return {
-                    'GoogleMapsReviews': int(gm_match.group(1)),
-                    'XTweets': int(x_match.group(1))
-                }
+            if 'GoogleMapsReviews' in weights and 'XTweets' in weights:
+                return weights
             
             return None
         
         except Exception:
             return None
     
-    def print_weights(self, weights: Dict[str, int]) -> None:
-        """
-        Print the weights in yellow color.
-        
-        Args:
-            weights: Dictionary containing the weights
-        """
-        gm_weight = weights.get('GoogleMapsReviews', 0)
-        x_weight = weights.get('XTweets', 0)
-    
     def check_gm_weight_alert(self, weights: Dict[str, int]) -> None:
         """
         Check if Google Maps weight changed from 0 and print alert.
@@ -102,31 +247,39 @@ class WeightChecker:
         
         if gm_weight != 0:
             # Alert: GM weight is not 0
-            print(f"{self.RED}{self.BOLD}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.RESET}")
-            print(f"{self.RED}{self.BOLD}⚠️  ALERT: GM WEIGHT CHANGED!{self.RESET}")
-            print(f"{self.RED}{self.BOLD}⚠️  CURRENT GM WEIGHT IS {gm_weight}{self.RESET}")
-            print(f"{self.RED}{self.BOLD}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{self.RESET}")
+            print(
+                f"{_BAR_RED}\n"
+                f"{_GM_ALERT_HEADER}\n"
+                f"{_RED}{_BOLD}⚠️  CURRENT GM WEIGHT IS {gm_weight}{_RESET}\n"
+                f"{_BAR_RED}"
+            )
         else:
             # Normal: GM weight remains 0
-            print(f"{self.GREEN}{self.BOLD}✓ GM WEIGHT REMAINS 0{self.RESET}")
+            print(_GM_REMAINS_0)
     
     async def check_and_display_weights(self) -> Tuple[bool, Optional[Dict[str, int]]]:
         """
         Main method to check weights from GitHub and display them.
+        Weights are only displayed when they differ from the last check.
         
         Returns:
-            Tuple of (success, weights_dict)
+            Tuple of (success, weights_dict); success is False whenever the latest fetch failed,
+            with weights_dict holding the last known (stale) weights if there are any
         """
         weights = await self.fetch_weights_from_github()
         
-        if weights is None:
-            return False, None
-        
-        # Print weights in yellow
-        self.print_weights(weights)
+        # Stale weights from before a failed fetch are returned but reported as a failure
+        if weights is None or self._last_fetch_failed:
+            return False, weights
         
-        # Check and alert for GM weight
-        self.check_gm_weight_alert(weights)
+        changed = (
+            weights.get('GoogleMapsReviews') != self.last_gm_weight
+            or weights.get('XTweets') != self.last_x_weight
+        )
+        if changed:
+            # Check and alert for GM weight; stdout writes run off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.check_gm_weight_alert, weights)
         
         # Store for future reference
         self.last_gm_weight = weights.get('GoogleMapsReviews')
@@ -135,8 +288,9 @@ class WeightChecker:
         return True, weights
 
 
-# Singleton instance
-_weight_checker_instance = None
+@functools.lru_cache(maxsize=None)
+def _make_weight_checker() -> WeightChecker:
+    return WeightChecker()
 
 
 def get_weight_checker() -> WeightChecker:
@@ -146,8 +300,4 @@ def get_weight_checker() -> WeightChecker:
     Returns:
         WeightChecker instance
     """
-    global _weight_checker_instance
-    if _weight_checker_instance is None:
-        _weight_checker_instance = WeightChecker()
-    return _weight_checker_instance
-
+    return _make_weight_checker()
@@ -80,7 +80,6 @@ async def test_with_mock_weights():
     print("Test Case 1: GM weight = 0, X weight = 100")
     print("-" * 70)
     mock_weights_1 = {'GoogleMapsReviews': 0, 'XTweets': 100}
-    weight_checker.print_weights(mock_weights_1)
     weight_checker.check_gm_weight_alert(mock_weights_1)
     print()
     
@@ -88,7 +87,6 @@ async def test_with_mock_weights():
     print("Test Case 2: GM weight = 50, X weight = 50")
     print("-" * 70)
     mock_weights_2 = {'GoogleMapsReviews': 50, 'XTweets': 50}
-    weight_checker.print_weights(mock_weights_2)
     weight_checker.check_gm_weight_alert(mock_weights_2)
     print()
     
@@ -96,11 +94,42 @@ async def test_with_mock_weights():
     print("Test Case 3: GM weight = 100, X weight = 0")
     print("-" * 70)
     mock_weights_3 = {'GoogleMapsReviews': 100, 'XTweets': 0}
-    weight_checker.print_weights(mock_weights_3)
     weight_checker.check_gm_weight_alert(mock_weights_3)
     print()
 
 
+def test_parse_weights():
+    """
+    Test parsing of the validator types file with mock content.
+    """
+    print()
+    print("=" * 70)
+    print("Testing Weight Parsing")
+    print("=" * 70)
+    print()
+    
+    weight_checker = get_weight_checker()
+    
+    content = (
+        b"import GoogleMapsReviews from './google-maps-reviews/index.js';\n"
+        b"import XTweets from './x-tweets/index.js';\n"
+        b"\n"
+        b"const TYPES = [\n"
+        b"  { func: GoogleMapsReviews, weight: 30 },\n"
+        b"  { func: XTweets, weight: 70 }\n"
+        b"]\n"
+    )
+    cases = [
+        ("Both types present", content, {'GoogleMapsReviews': 30, 'XTweets': 70}),
+        ("Missing XTweets entry", content.replace(b"XTweets, weight", b"Other, weight"), None),
+    ]
+    
+    for name, case_content, expected in cases:
+        result = weight_checker._parse_weights(case_content)
+        print(f"{'✓' if result == expected else '✗'} {name}: {result}")
+        assert result == expected, f"{name}: expected {expected}, got {result}"
+
+
 async def main():
     """
     Main test function.
@@ -111,6 +140,16 @@ async def main():
     # Test with mock data
     await test_with_mock_weights()
     
+    # Test parsing with mock content
+    try:
+        test_parse_weights()
+    except AssertionError as e:
+        print(f"✗ Weight parsing failed: {e}")
+        exit_code = 1
+    
+    # Release the shared GitHub session
+    await get_weight_checker().close()
+    
     print()
     print("=" * 70)
     print("Test completed!")